@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 
 from data_loader import DataLoader
 from model import Issue
+from shared_dataset import SharedDataset
 import config
 
 class AnalysisOne:
@@ -13,13 +14,16 @@ class AnalysisOne:
     - Avg. issue lifespan
     - Avg. number of comments
     - Number of contributors involved
+
+    With --workers greater than 1, the statistics are computed in parallel
+    worker processes that share a memory-mapped copy of the issues.
     """
 
     def __init__(self):
         self.USER: str = config.get_parameter('user')
+        self.WORKERS: int = config.get_parameter('workers')
 
-    def run(self):
-        issues: List[Issue] = DataLoader().get_issues()
+    def compute_label_stats(self, issues: List[Issue]) -> pd.DataFrame:
         label_stats: Dict[str, List[Dict]] = defaultdict(list)
 
         for issue in issues:
@@ -62,7 +66,16 @@ class AnalysisOne:
                 "num_contributors": len(all_contributors)
             })
 
-        df = pd.DataFrame(results)
+        return pd.DataFrame(results)
+
+    def run(self):
+        issues: List[Issue] = DataLoader().get_issues()
+
+        if self.WORKERS and self.WORKERS > 1:
+            with SharedDataset.create(issues) as dataset:
+                df = dataset.parallel_label_stats(self.WORKERS)
+        else:
+            df = self.compute_label_stats(issues)
         df = df.sort_values(by="avg_lifespan_hours", ascending=False)
 
         # User interaction
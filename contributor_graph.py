@@ -0,0 +1,224 @@
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from data_loader import DataLoader
+from model import Issue
+import config
+
+
+class ContributorGraph:
+    """
+    Builds a contributor interaction graph from the issue creators and
+    event authors and answers questions about it:
+    - For a specific user (--user): top collaborators, labels worked on
+      and activity over time
+    - For the whole graph: degree distribution and connected components
+
+    The graph is stored as sparse matrices built in a single pass over
+    the events:
+    - user x issue: number of interactions of a user with an issue
+    - user x user: number of issues two users have both participated in
+    - user x label: number of interactions of a user on issues with a label
+    - user x month: number of interactions of a user per month
+    """
+
+    def __init__(self):
+        self.USER: str = config.get_parameter('user')
+
+        self.users: List[str] = []
+        self.user_index: Dict[str, int] = {}
+        self.labels: List[str] = []
+        self.months: pd.PeriodIndex = None
+
+        self.user_issue: sparse.csr_matrix = None
+        self.user_user: sparse.csr_matrix = None
+        self.user_label: sparse.csr_matrix = None
+        self.user_month: sparse.csr_matrix = None
+
+    def build(self, issues: List[Issue]):
+        """
+        Builds all sparse matrices of the graph from the issues.
+        """
+        label_index: Dict[str, int] = {}
+        rows, cols, month_keys = [], [], []
+        label_rows, label_cols = [], []
+
+        def add(author, issue_idx, date):
+            if not author:
+                return
+            user_idx = self.user_index.get(author)
+            if user_idx is None:
+                user_idx = self.user_index[author] = len(self.users)
+                self.users.append(author)
+            rows.append(user_idx)
+            cols.append(issue_idx)
+            month_keys.append(date.year * 12 + date.month - 1 if date else -1)
+
+        for i, issue in enumerate(issues):
+            for label in issue.labels:
+                label_rows.append(i)
+                label_cols.append(label_index.setdefault(label, len(label_index)))
+            add(issue.creator, i, issue.created_date)
+            for e in issue.events:
+                add(e.author, i, e.event_date)
+        self.labels = list(label_index)
+
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        month_keys = np.asarray(month_keys, dtype=np.int64)
+        n_users, n_issues = len(self.users), len(issues)
+
+        # Duplicate (user, issue) entries are summed into interaction counts
+        self.user_issue = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)), shape=(n_users, n_issues)
+        )
+
+        participation = self.user_issue.copy()
+        participation.data[:] = 1
+        # Every user participates in at least one issue, so the diagonal is
+        # already stored and clearing it does not change the sparsity structure
+        self.user_user = (participation @ participation.T).tocsr()
+        self.user_user.setdiag(0)
+        self.user_user.eliminate_zeros()
+
+        issue_label = sparse.csr_matrix(
+            (np.ones(len(label_rows), dtype=np.int64), (label_rows, label_cols)),
+            shape=(n_issues, len(self.labels))
+        )
+        self.user_label = (self.user_issue @ issue_label).tocsr()
+
+        dated = month_keys >= 0
+        if dated.any():
+            first_month = month_keys[dated].min()
+            n_months = month_keys[dated].max() - first_month + 1
+            self.months = pd.period_range(
+                start=pd.Period(year=first_month // 12, month=first_month % 12 + 1, freq='M'),
+                periods=n_months, freq='M'
+            )
+            self.user_month = sparse.csr_matrix(
+                (np.ones(dated.sum(), dtype=np.int64), (rows[dated], month_keys[dated] - first_month)),
+                shape=(n_users, n_months)
+            )
+        else:
+            self.months = pd.PeriodIndex([], freq='M')
+            self.user_month = sparse.csr_matrix((n_users, 0), dtype=np.int64)
+        return self
+
+    def _top_of_row(self, matrix: sparse.csr_matrix, row: int, names: List[str], n: int) -> List[Tuple[str, int]]:
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        indices, data = matrix.indices[start:end], matrix.data[start:end]
+        if len(data) > n:
+            top = np.argpartition(-data, n)[:n]
+            indices, data = indices[top], data[top]
+        order = np.argsort(-data, kind='stable')
+        return [(names[indices[k]], int(data[k])) for k in order]
+
+    def top_collaborators(self, user: str, n: int = 10) -> List[Tuple[str, int]]:
+        """
+        Returns the users that share the most issues with the given user,
+        together with the number of shared issues.
+        """
+        return self._top_of_row(self.user_user, self.user_index[user], self.users, n)
+
+    def labels_worked_on(self, user: str, n: int = 10) -> List[Tuple[str, int]]:
+        """
+        Returns the labels the given user interacted with the most, together
+        with the number of interactions.
+        """
+        return self._top_of_row(self.user_label, self.user_index[user], self.labels, n)
+
+    def activity_over_time(self, user: str) -> pd.Series:
+        """
+        Returns the number of interactions of the given user per month.
+        """
+        row = self.user_month.getrow(self.user_index[user]).toarray().ravel()
+        return pd.Series(row, index=self.months)
+
+    def degrees(self) -> np.ndarray:
+        """
+        Returns the number of distinct collaborators of every user.
+        """
+        return np.diff(self.user_user.indptr)
+
+    def components(self) -> np.ndarray:
+        """
+        Returns the sizes of the connected components, largest first.
+        """
+        n_components, component_of = connected_components(self.user_user, directed=False)
+        return np.sort(np.bincount(component_of, minlength=n_components))[::-1]
+
+    def run(self):
+        issues: List[Issue] = DataLoader().get_issues()
+        self.build(issues)
+
+        if self.USER:
+            self.run_user(self.USER)
+        else:
+            self.run_graph()
+
+    def run_user(self, user: str):
+        if user not in self.user_index:
+            print(f"No interactions found for user: {user}")
+            return
+
+        print(f"\nTop collaborators of {user}:")
+        for name, shared in self.top_collaborators(user):
+            print(f"- {name}: {shared} shared issues")
+
+        print(f"\nLabels {user} worked on:")
+        for label, count in self.labels_worked_on(user):
+            print(f"- {label}: {count} interactions")
+
+        activity = self.activity_over_time(user)
+        if not activity.any():
+            print(f"\nNo dated activity found for user: {user}")
+            return
+        # Start the chart at the first month the user was active
+        activity = activity.loc[activity.ne(0).idxmax():]
+        activity.plot(kind='line', marker='o', figsize=(12, 6), title=f"Monthly Activity of {user}")
+        plt.xlabel("Month")
+        plt.ylabel("Number of Interactions")
+        plt.grid(True, linestyle='--', alpha=0.5)
+        plt.tight_layout()
+        plt.show()
+
+    def run_graph(self):
+        degrees = self.degrees()
+        sizes = self.components()
+
+        print(f"\nContributors: {len(self.users)}")
+        print(f"Issues: {self.user_issue.shape[1]}")
+        print(f"Collaboration edges: {self.user_user.nnz // 2}")
+        print(f"Connected components: {len(sizes)}")
+        if len(sizes):
+            print(f"Largest component: {sizes[0]} contributors")
+            print(f"Isolated contributors: {int((sizes == 1).sum())}")
+            print(f"Degree: mean {degrees.mean():.2f}, median {np.median(degrees):.0f}, max {degrees.max()}")
+
+            top = np.argsort(-degrees, kind='stable')[:10]
+            print("\nTop 10 contributors by number of collaborators:")
+            for idx in top:
+                print(f"- {self.users[idx]}: {degrees[idx]}")
+
+        distribution = np.bincount(degrees) if len(degrees) else np.array([], dtype=np.int64)
+        nonzero = distribution.nonzero()[0]
+        nonzero = nonzero[nonzero > 0]
+        if not len(nonzero):
+            print("No collaborations to display.")
+            return
+        plt.figure(figsize=(10, 6))
+        plt.loglog(nonzero, distribution[nonzero], marker='o', linestyle='none')
+        plt.title("Degree Distribution of the Contributor Graph")
+        plt.xlabel("Number of Collaborators")
+        plt.ylabel("Number of Contributors")
+        plt.grid(True, linestyle='--', alpha=0.5)
+        plt.tight_layout()
+        plt.show()
+
+
+if __name__ == '__main__':
+    ContributorGraph().run()
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from contributor_graph import ContributorGraph
+from model import Issue
+
+
+def _issue(creator, labels, authors, created_date="2020-01-15T00:00:00Z"):
+    return Issue({
+        "state": "open",
+        "number": 1,
+        "creator": creator,
+        "labels": labels,
+        "created_date": created_date,
+        "events": [{"event_type": "commented", "author": a, "event_date": "2020-03-01T00:00:00Z"}
+                   for a in authors],
+    })
+
+
+class TestContributorGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = ContributorGraph().build([
+            _issue("a", ["x"], ["b", "c"]),
+            _issue("a", ["y"], ["b", "b", ""]),
+            _issue("d", ["x"], ["e"]),
+            _issue("f", [], []),
+        ])
+
+    def _shared(self, u, v):
+        return self.graph.user_user[self.graph.user_index[u], self.graph.user_index[v]]
+
+    def test_co_participation_counts(self):
+        self.assertEqual(self.graph.users, ["a", "b", "c", "d", "e", "f"])
+        self.assertEqual(self._shared("a", "b"), 2)
+        self.assertEqual(self._shared("b", "a"), 2)
+        self.assertEqual(self._shared("a", "c"), 1)
+        self.assertEqual(self._shared("b", "c"), 1)
+        self.assertEqual(self._shared("d", "e"), 1)
+        self.assertEqual(self._shared("a", "d"), 0)
+
+    def test_diagonal_is_cleared(self):
+        self.assertFalse(self.graph.user_user.diagonal().any())
+        self.assertEqual(self.graph.user_user.nnz, 8)
+
+    def test_queries(self):
+        self.assertEqual(self.graph.top_collaborators("a"), [("b", 2), ("c", 1)])
+        self.assertEqual(self.graph.top_collaborators("a", n=1), [("b", 2)])
+        self.assertEqual(self.graph.top_collaborators("f"), [])
+        self.assertEqual(self.graph.labels_worked_on("b"), [("y", 2), ("x", 1)])
+
+        activity = self.graph.activity_over_time("a")
+        self.assertEqual(list(activity.index.astype(str)), ["2020-01", "2020-02", "2020-03"])
+        self.assertEqual(list(activity), [2, 0, 0])
+
+    def test_degrees_and_components(self):
+        np.testing.assert_array_equal(self.graph.degrees(), [2, 2, 2, 1, 1, 0])
+        np.testing.assert_array_equal(self.graph.components(), [3, 2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,43 +1,162 @@
 
 import json
-from typing import List
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List
 
 import config
 from model import Issue
 
 # Store issues as singleton to avoid reloads
 _ISSUES:List[Issue] = None
+# Validation report of the load that produced _ISSUES
+_LOAD_REPORT:'LoadReport' = None
+
+
+class LoadReport:
+    """
+    Summary of the validation stage of the loader.
+    """
+
+    def __init__(self):
+        self.total_records:int = 0
+        self.malformed_records:int = 0
+        self.duplicate_records:int = 0
+        # Duplicates whose updated_date could not be compared; the first copy is kept
+        self.incomparable_duplicates:int = 0
+        self.invalid_fields:Counter = Counter()
+        self.errors:Counter = Counter()
+
+    def is_clean(self) -> bool:
+        return not (self.malformed_records or self.duplicate_records or self.invalid_fields)
+
+    def __str__(self):
+        lines = [f'Validated {self.total_records} records: '
+                 f'{self.malformed_records} malformed, {self.duplicate_records} duplicates.']
+        if self.incomparable_duplicates:
+            lines.append(f'- {self.incomparable_duplicates} duplicates with incomparable updated_date, kept the first copy')
+        for error, count in self.errors.most_common():
+            lines.append(f'- {count} skipped: {error}')
+        for field, count in self.invalid_fields.most_common():
+            lines.append(f'- {count} invalid {field}')
+        return '\n'.join(lines)
+
 
 class DataLoader:
     """
     Loads the issue data into a runtime object.
     """
-    
+
     def __init__(self):
         """
         Constructor
         """
         self.data_path:str = config.get_parameter('ENPM611_PROJECT_DATA_PATH')
-        
+        self.validate:bool = config.get_parameter('ENPM611_PROJECT_VALIDATE_DATA', True)
+        self.deduplicate:bool = config.get_parameter('ENPM611_PROJECT_DEDUPLICATE', True)
+
     def get_issues(self):
         """
         This should be invoked by other parts of the application to get access
         to the issues in the data file.
         """
-        global _ISSUES # to access it within the function
+        global _ISSUES, _LOAD_REPORT # to access it within the function
         if _ISSUES is None:
-            _ISSUES = self._load()
+            _ISSUES, _LOAD_REPORT = self._load()
             print(f'Loaded {len(_ISSUES)} issues from {self.data_path}.')
+            if _LOAD_REPORT is not None and not _LOAD_REPORT.is_clean():
+                print(_LOAD_REPORT)
         return _ISSUES
-    
+
+    def get_load_report(self):
+        """
+        Returns the validation report of the loaded issues, or None if
+        validation is disabled.
+        """
+        self.get_issues()
+        return _LOAD_REPORT
+
     def _load(self):
         """
         Loads the issues into memory.
         """
         with open(self.data_path,'r') as fin:
-            return [Issue(i) for i in json.load(fin)]
-    
+            records = json.load(fin)
+        if not self.validate:
+            return [Issue(i) for i in records], None
+        return self._validate(records)
+
+    def _validate(self, records:List[dict]):
+        """
+        Parses the records in a single pass. Records that cannot be parsed
+        are skipped and counted instead of aborting the load, unparsable
+        fields are counted, and issues that appear more than once are
+        reduced to the one with the latest updated_date.
+        """
+        report = LoadReport()
+        report.total_records = len(records)
+        issues:List[Issue] = []
+        # Position in issues of each issue number seen so far
+        positions:Dict[int, int] = {}
+
+        for record in records:
+            if not isinstance(record, dict):
+                report.malformed_records += 1
+                report.errors[f'record is {type(record).__name__}, not an object'] += 1
+                continue
+            try:
+                issue = Issue(record)
+            except (KeyError, ValueError, TypeError, AttributeError) as e:
+                report.malformed_records += 1
+                report.errors[f'{type(e).__name__}: {e}'] += 1
+                continue
+
+            if issue.invalid_fields:
+                report.invalid_fields.update(issue.invalid_fields)
+            for event in issue.events:
+                if event.invalid_fields:
+                    report.invalid_fields.update(event.invalid_fields)
+
+            if not self.deduplicate or issue.number < 0:
+                issues.append(issue)
+                continue
+            pos = positions.get(issue.number)
+            if pos is None:
+                positions[issue.number] = len(issues)
+                issues.append(issue)
+                continue
+
+            report.duplicate_records += 1
+            try:
+                newer = _is_newer(issues[pos].updated_date, issue.updated_date)
+            except (OverflowError, ValueError, OSError):
+                report.incomparable_duplicates += 1
+                continue
+            if newer:
+                issues[pos] = issue
+
+        return issues, report
+
+
+def _is_newer(kept:datetime, candidate:datetime) -> bool:
+    """
+    Whether the candidate updated_date is at least as recent as the kept one.
+    Missing dates are the oldest, and naive dates are treated as UTC so that
+    they can be compared with dates that carry a timezone.
+    """
+    if kept is None:
+        return True
+    if candidate is None:
+        return False
+    return _utc_timestamp(candidate) >= _utc_timestamp(kept)
+
+
+def _utc_timestamp(date:datetime) -> float:
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
+
 
 if __name__ == '__main__':
     # Run the loader for testing
-    DataLoader().get_issues()
\ No newline at end of file
+    DataLoader().get_issues()
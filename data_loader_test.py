@@ -0,0 +1,126 @@
+import unittest
+
+from data_loader import DataLoader
+
+
+def _record(number=1, title=None, **fields):
+    record = {"state": "open", "number": number, "title": title, "labels": [], "events": []}
+    record.update(fields)
+    return record
+
+
+class TestValidate(unittest.TestCase):
+
+    def setUp(self):
+        self.loader = DataLoader()
+        self.loader.deduplicate = True
+
+    def test_clean_records(self):
+        issues, report = self.loader._validate([_record(1), _record(2)])
+
+        self.assertEqual([i.number for i in issues], [1, 2])
+        self.assertTrue(report.is_clean())
+
+    def test_duplicate_keeps_latest_updated_date(self):
+        issues, report = self.loader._validate([
+            _record(title="old", updated_date="2020-01-02T00:00:00Z"),
+            _record(title="new", updated_date="2020-01-03T00:00:00Z"),
+            _record(title="older", updated_date="2020-01-01T00:00:00Z"),
+        ])
+
+        self.assertEqual([i.title for i in issues], ["new"])
+        self.assertEqual(report.duplicate_records, 2)
+        self.assertFalse(report.is_clean())
+
+    def test_duplicate_naive_and_aware_dates(self):
+        issues, report = self.loader._validate([
+            _record(title="naive", updated_date="2020-01-02"),
+            _record(title="aware", updated_date="2020-01-03T00:00:00Z"),
+            _record(title="offset", updated_date="2020-01-02T23:00:00-05:00"),
+        ])
+
+        self.assertEqual([i.title for i in issues], ["offset"])
+        self.assertEqual(report.incomparable_duplicates, 0)
+
+    def test_duplicate_tie_keeps_later_record(self):
+        issues, _ = self.loader._validate([
+            _record(title="first", updated_date="2020-01-02T00:00:00Z"),
+            _record(title="second", updated_date="2020-01-02T00:00:00Z"),
+        ])
+
+        self.assertEqual([i.title for i in issues], ["second"])
+
+    def test_duplicate_missing_updated_date(self):
+        issues, _ = self.loader._validate([
+            _record(1, title="missing"),
+            _record(1, title="dated", updated_date="2020-01-02T00:00:00Z"),
+            _record(2, title="dated", updated_date="2020-01-02T00:00:00Z"),
+            _record(2, title="missing"),
+        ])
+
+        self.assertEqual([i.title for i in issues], ["dated", "dated"])
+
+    def test_deduplication_disabled(self):
+        self.loader.deduplicate = False
+        issues, report = self.loader._validate([_record(1), _record(1)])
+
+        self.assertEqual(len(issues), 2)
+        self.assertEqual(report.duplicate_records, 0)
+
+    def test_unknown_state_is_skipped(self):
+        issues, report = self.loader._validate([_record(1, state="bogus"), _record(2)])
+
+        self.assertEqual([i.number for i in issues], [2])
+        self.assertEqual(report.malformed_records, 1)
+        self.assertEqual(sum(report.errors.values()), 1)
+
+    def test_non_object_records_are_skipped(self):
+        issues, report = self.loader._validate([None, 5, "issue", [], _record(1)])
+
+        self.assertEqual([i.number for i in issues], [1])
+        self.assertEqual(report.total_records, 5)
+        self.assertEqual(report.malformed_records, 4)
+
+    def test_invalid_dates_are_counted(self):
+        issues, report = self.loader._validate([
+            _record(created_date="not a date", closed_date=None,
+                    events=[{"event_type": "commented", "event_date": "zz"}]),
+        ])
+
+        self.assertIsNone(issues[0].created_date)
+        self.assertIsNone(issues[0].events[0].event_date)
+        self.assertEqual(report.invalid_fields["created_date"], 1)
+        self.assertEqual(report.invalid_fields["event_date"], 1)
+        self.assertNotIn("closed_date", report.invalid_fields)
+
+    def test_invalid_lists_are_counted(self):
+        issues, report = self.loader._validate([
+            _record(1, labels=None, assignees="someone"),
+            _record(2, events=None),
+        ])
+
+        self.assertEqual([(i.labels, i.assignees, i.events) for i in issues], [([], [], []), ([], [], [])])
+        self.assertEqual(report.invalid_fields["labels"], 1)
+        self.assertEqual(report.invalid_fields["assignees"], 1)
+        self.assertEqual(report.invalid_fields["events"], 1)
+
+    def test_invalid_events_are_skipped(self):
+        issues, report = self.loader._validate([
+            _record(events=[5, None, {"event_type": "commented"}]),
+        ])
+
+        self.assertEqual([e.event_type for e in issues[0].events], ["commented"])
+        self.assertEqual(report.invalid_fields["events"], 2)
+
+    def test_missing_number_is_counted(self):
+        record = _record()
+        del record["number"]
+        issues, report = self.loader._validate([record, _record("x")])
+
+        self.assertEqual([i.number for i in issues], [-1, -1])
+        self.assertEqual(report.invalid_fields["number"], 2)
+        self.assertFalse(report.is_clean())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+
+from data_loader import DataLoader
+from model import Issue
+import config
+
+HOUR = np.timedelta64(1, 'h')
+
+
+class LifecycleAnalysis:
+    """
+    Analyze the lifecycle of GitHub issues from their timeline events and
+    outputs per-label percentiles (p50/p90/p99) of:
+    - Time to first response (first comment not written by the issue creator)
+    - Time to first label
+    - Time between consecutive labeled events
+    - Number of reopens
+    - Issue lifespan
+
+    All events are flattened into one table sorted by issue and event date,
+    so every metric is computed with grouped, vectorized operations instead
+    of per-issue Python loops.
+    """
+
+    PERCENTILES = [0.5, 0.9, 0.99]
+
+    METRICS = {
+        "first_response_hours": "Time to First Response (hours)",
+        "first_label_hours": "Time to First Label (hours)",
+        "label_gap_hours": "Time Between Labeled Events (hours)",
+        "reopens": "Number of Reopens",
+        "lifespan_hours": "Issue Lifespan (hours)",
+    }
+
+    def __init__(self):
+        self.LABEL: str = config.get_parameter('label')
+
+    def build_tables(self, issues: List[Issue]):
+        """
+        Flattens the issues into an issue table, an issue/label table and an
+        event table. The event table is sorted by issue and event date and
+        carries the time elapsed since the issue was created.
+        """
+        created, closed, creators = [], [], []
+        label_issue, label_names = [], []
+        event_issue, event_types, event_authors, event_dates = [], [], [], []
+
+        for i, issue in enumerate(issues):
+            created.append(issue.created_date)
+            closed.append(issue.closed_date)
+            creators.append(issue.creator)
+            for label in issue.labels:
+                label_issue.append(i)
+                label_names.append(label)
+            for e in issue.events:
+                event_issue.append(i)
+                event_types.append(e.event_type)
+                event_authors.append(e.author)
+                event_dates.append(e.event_date)
+
+        issue_df = pd.DataFrame({
+            "created_date": _to_utc(created),
+            "closed_date": _to_utc(closed),
+            "creator": creators,
+        })
+        label_df = pd.DataFrame({
+            "issue": np.asarray(label_issue, dtype=np.int64),
+            "label": label_names,
+        })
+        event_df = pd.DataFrame({
+            "issue": np.asarray(event_issue, dtype=np.int64),
+            "event_type": event_types,
+            "author": event_authors,
+            "event_date": _to_utc(event_dates),
+        })
+        event_df = event_df.dropna(subset=["event_date"])
+        event_df = event_df.sort_values(["issue", "event_date"], kind="mergesort", ignore_index=True)
+
+        issue_idx = event_df["issue"].to_numpy()
+        event_df["elapsed_hours"] = (
+            event_df["event_date"].to_numpy() - issue_df["created_date"].to_numpy()[issue_idx]
+        ) / HOUR
+        # Events without an author are never attributed to the creator
+        event_df["by_creator"] = (
+            event_df["author"].fillna("").ne("")
+            & (event_df["author"].to_numpy() == issue_df["creator"].to_numpy()[issue_idx])
+        )
+
+        return issue_df, label_df, event_df
+
+    def compute_issue_metrics(self, issue_df: pd.DataFrame, event_df: pd.DataFrame):
+        """
+        Computes one row of lifecycle metrics per issue, plus one row per gap
+        between consecutive labeled events of the same issue.
+        """
+        event_type = event_df["event_type"]
+
+        responses = event_df[event_type.eq("commented") & ~event_df["by_creator"]]
+        labeled = event_df[event_type.eq("labeled")]
+
+        metrics = pd.DataFrame(index=issue_df.index)
+        # Events are sorted by date within each issue, so first() is the earliest
+        metrics["first_response_hours"] = responses.groupby("issue")["elapsed_hours"].first()
+        metrics["first_label_hours"] = labeled.groupby("issue")["elapsed_hours"].first()
+        metrics["reopens"] = (
+            event_type.eq("reopened").groupby(event_df["issue"]).sum()
+            .reindex(issue_df.index, fill_value=0)
+        )
+        metrics["lifespan_hours"] = (issue_df["closed_date"] - issue_df["created_date"]) / HOUR
+
+        label_gaps = pd.DataFrame({
+            "issue": labeled["issue"],
+            "label_gap_hours": labeled.groupby("issue")["event_date"].diff() / HOUR,
+        }).dropna()
+
+        return metrics, label_gaps
+
+    def percentiles_by_label(self, label_df: pd.DataFrame, metrics: pd.DataFrame,
+                             label_gaps: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Joins the per-issue metrics onto the labels of each issue and returns,
+        for every metric, a table with the number of samples and the
+        percentiles per label.
+        """
+        per_label = label_df.merge(metrics, left_on="issue", right_index=True)
+        gaps_per_label = label_df.merge(label_gaps, on="issue")
+
+        tables = {}
+        for column in self.METRICS:
+            source = gaps_per_label if column == "label_gap_hours" else per_label
+            tables[column] = self._percentile_table(source, column)
+        return tables
+
+    def _percentile_table(self, df: pd.DataFrame, column: str) -> pd.DataFrame:
+        columns = [f"p{int(q * 100)}" for q in self.PERCENTILES]
+        df = df.dropna(subset=[column])
+        if df.empty:
+            return pd.DataFrame(columns=["n"] + columns, index=pd.Index([], name="label"))
+
+        grouped = df.groupby("label")[column]
+        table = grouped.quantile(self.PERCENTILES).unstack()
+        table.columns = columns
+        table.insert(0, "n", grouped.size())
+        return table.round(2).sort_values("p50", ascending=False)
+
+    def run(self):
+        issues: List[Issue] = DataLoader().get_issues()
+
+        issue_df, label_df, event_df = self.build_tables(issues)
+        if self.LABEL:
+            label_df = label_df[label_df["label"] == self.LABEL]
+            if label_df.empty:
+                print(f"No issues found with label: {self.LABEL}")
+                return
+
+        metrics, label_gaps = self.compute_issue_metrics(issue_df, event_df)
+        tables = self.percentiles_by_label(label_df, metrics, label_gaps)
+
+        for column, title in self.METRICS.items():
+            print(f"\n{title}")
+            if tables[column].empty:
+                print("No data to display.")
+            else:
+                print(tables[column].to_string())
+
+        # Plot only when looking at all labels
+        if self.LABEL:
+            return
+
+        first_response = tables["first_response_hours"]
+        if first_response.empty:
+            return
+        first_response.nlargest(10, "n")[["p50", "p90"]].plot(
+            kind="bar", figsize=(12, 6),
+            title="Time to First Response for the 10 Most Used Labels"
+        )
+        plt.ylabel("Hours")
+        plt.xticks(rotation=45, ha='right')
+        plt.tight_layout()
+        plt.show()
+
+
+def _to_utc(dates: list) -> pd.Series:
+    """
+    Converts a list of (possibly missing) datetimes into a naive UTC
+    datetime64 series so that differences stay vectorized.
+    """
+    return pd.Series(pd.to_datetime(dates, utc=True).tz_localize(None))
+
+
+if __name__ == '__main__':
+    LifecycleAnalysis().run()
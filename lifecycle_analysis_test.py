@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from lifecycle_analysis import LifecycleAnalysis
+from model import Issue
+
+
+class TestPercentilesByLabel(unittest.TestCase):
+
+    def test_metric_without_samples(self):
+        label_df = pd.DataFrame({"issue": [0], "label": ["rare"]})
+        metrics = pd.DataFrame({
+            "first_response_hours": [np.nan],
+            "first_label_hours": [1.0],
+            "reopens": [0],
+            "lifespan_hours": [np.nan],
+        })
+        label_gaps = pd.DataFrame({"issue": pd.Series([], dtype=np.int64),
+                                   "label_gap_hours": pd.Series([], dtype=float)})
+
+        tables = LifecycleAnalysis().percentiles_by_label(label_df, metrics, label_gaps)
+
+        for column in ["first_response_hours", "label_gap_hours", "lifespan_hours"]:
+            self.assertTrue(tables[column].empty)
+            self.assertEqual(list(tables[column].columns), ["n", "p50", "p90", "p99"])
+        self.assertEqual(tables["first_label_hours"].loc["rare", "p50"], 1.0)
+
+
+class TestFirstResponse(unittest.TestCase):
+
+    def test_comment_without_author_is_a_response(self):
+        issue = Issue({
+            "state": "open",
+            "labels": ["bug"],
+            "created_date": "2020-01-01T00:00:00Z",
+            "events": [{"event_type": "commented", "event_date": "2020-01-01T02:00:00Z"}],
+        })
+
+        analysis = LifecycleAnalysis()
+        issue_df, _, event_df = analysis.build_tables([issue])
+        metrics, _ = analysis.compute_issue_metrics(issue_df, event_df)
+
+        self.assertFalse(event_df["by_creator"].any())
+        self.assertEqual(metrics.loc[0, "first_response_hours"], 2.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
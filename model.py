@@ -17,6 +17,33 @@ class State(str, Enum):
     closed = 'closed'
 
 
+def _parse_date(value:any, field:str, invalid_fields:List[str]) -> datetime:
+    """
+    Parses a date string. Missing dates are None, and dates that cannot
+    be parsed are recorded in invalid_fields instead of raising.
+    """
+    if not value:
+        return None
+    try:
+        return parser.parse(value)
+    except (ValueError, TypeError, OverflowError):
+        invalid_fields.append(field)
+        return None
+
+
+def _parse_list(jobj:any, field:str, invalid_fields:List[str]) -> list:
+    """
+    Reads a list field. A missing field is an empty list, and a field that
+    is null or not a list is recorded in invalid_fields and treated as empty.
+    """
+    value = jobj.get(field)
+    if isinstance(value, list):
+        return value
+    if field in jobj:
+        invalid_fields.append(field)
+    return []
+
+
 class Event:
     
     def __init__(self, jobj:any):
@@ -25,6 +52,7 @@ class Event:
         self.event_date:datetime = None
         self.label:str = None
         self.comment:str = None
+        self.invalid_fields:List[str] = []
         
         if jobj is not None:
             self.from_json(jobj)
@@ -32,10 +60,7 @@ class Event:
     def from_json(self, jobj:any):
         self.event_type = jobj.get('event_type')
         self.author = jobj.get('author')
-        try:
-            self.event_date = parser.parse(jobj.get('event_date'))
-        except:
-            pass
+        self.event_date = _parse_date(jobj.get('event_date'), 'event_date', self.invalid_fields)
         self.label = jobj.get('label')
         self.comment = jobj.get('comment')
         
@@ -56,6 +81,7 @@ class Issue:
         self.closed_date:datetime = None
         self.timeline_url:str = None
         self.events:List[Event] = []
+        self.invalid_fields:List[str] = []
         
         if jobj is not None:
             self.from_json(jobj)
@@ -63,26 +89,24 @@ class Issue:
     def from_json(self, jobj:any):
         self.url = jobj.get('url')
         self.creator = jobj.get('creator')
-        self.labels = jobj.get('labels',[])
+        self.labels = _parse_list(jobj, 'labels', self.invalid_fields)
         self.state = State[jobj.get('state')]
-        self.assignees = jobj.get('assignees',[])
+        self.assignees = _parse_list(jobj, 'assignees', self.invalid_fields)
         self.title = jobj.get('title')
         self.text = jobj.get('text')
+        # number is the deduplication key, so a missing number is recorded too
         try:
-            self.number = int(jobj.get('number','-1'))
-        except:
-            pass
-        try:
-            self.created_date = parser.parse(jobj.get('created_date'))
-        except:
-            pass
-        try:
-            self.updated_date = parser.parse(jobj.get('updated_date'))
-        except:
-            pass
-        try:
-            self.closed_date = parser.parse(jobj.get('closed_date'))
-        except:
-            pass
+            self.number = int(jobj.get('number'))
+        except (ValueError, TypeError):
+            self.invalid_fields.append('number')
+        self.created_date = _parse_date(jobj.get('created_date'), 'created_date', self.invalid_fields)
+        self.updated_date = _parse_date(jobj.get('updated_date'), 'updated_date', self.invalid_fields)
+        self.closed_date = _parse_date(jobj.get('closed_date'), 'closed_date', self.invalid_fields)
         self.timeline_url = jobj.get('timeline_url')
-        self.events = [Event(jevent) for jevent in jobj.get('events',[])]
\ No newline at end of file
+        # Events that are not objects are skipped and recorded, keeping the valid ones
+        self.events = []
+        for jevent in _parse_list(jobj, 'events', self.invalid_fields):
+            if isinstance(jevent, dict):
+                self.events.append(Event(jevent))
+            else:
+                self.invalid_fields.append('events')
\ No newline at end of file
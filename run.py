@@ -10,6 +10,8 @@ from feature2 import LabelCommentGraph
 import config
 from pieChart_Labels import LabelPieChartAnalysis
 from analysis_one import AnalysisOne
+from lifecycle_analysis import LifecycleAnalysis
+from contributor_graph import ContributorGraph
 
 
 def parse_args():
@@ -26,7 +28,7 @@ def parse_args():
     
     # Required parameter specifying what analysis to run
     ap.add_argument('--feature', '-f', type=int, required=True,
-                    help='Which of the three features to run')
+                    help='Which of the features to run')
     
     # Optional parameter for analyses focusing on a specific user (i.e., contributor)
     ap.add_argument('--user', '-u', type=str, required=False,
@@ -36,22 +38,31 @@ def parse_args():
     ap.add_argument('--label', '-l', type=str, required=False,
                     help='Optional parameter for analyses focusing on a specific label')
     
+    # Optional parameter to run the label statistics in parallel worker processes
+    ap.add_argument('--workers', '-w', type=int, required=False,
+                    help='Optional number of worker processes for the label statistics')
+    
     return ap.parse_args()
 
 
 
-# Parse feature to call from command line arguments
-args = parse_args()
-# Add arguments to config so that they can be accessed in other parts of the application
-config.overwrite_from_args(args)
+if __name__ == '__main__':
+    # Parse feature to call from command line arguments
+    args = parse_args()
+    # Add arguments to config so that they can be accessed in other parts of the application
+    config.overwrite_from_args(args)
     
-# Run the feature specified in the --feature flag
-if args.feature == 1:
-    AnalysisOne().run()
-elif args.feature == 2:
-    graph = LabelCommentGraph()
-    graph.run()
-elif args.feature == 3:
-    LabelPieChartAnalysis().run() # TODO call third analysis
-else:
-    print('Need to specify which feature to run with --feature flag.')
+    # Run the feature specified in the --feature flag
+    if args.feature == 1:
+        AnalysisOne().run()
+    elif args.feature == 2:
+        graph = LabelCommentGraph()
+        graph.run()
+    elif args.feature == 3:
+        LabelPieChartAnalysis().run() # TODO call third analysis
+    elif args.feature == 4:
+        LifecycleAnalysis().run()
+    elif args.feature == 5:
+        ContributorGraph().run()
+    else:
+        print('Need to specify which feature to run with --feature flag.')
@@ -0,0 +1,282 @@
+"""
+Implements a read-only, columnar copy of the issues that is stored in a
+memory-mapped file. Worker processes attach to the file by its path and
+read the columns zero-copy, so analyses can be split across processes
+without pickling the Issue/Event objects or reloading the JSON.
+"""
+
+import json
+import os
+import struct
+import tempfile
+from multiprocessing import Pool
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from model import Issue, State
+
+_MAGIC = b'ENPM611D'
+_ALIGNMENT = 64
+
+# Dataset attached by each worker process of the pool
+_WORKER_DATASET: 'SharedDataset' = None
+
+
+class _StringTable:
+    """
+    Interns strings into consecutive integer ids. Missing values are -1.
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, value: str) -> int:
+        if not value:
+            return -1
+        idx = self.ids.get(value)
+        if idx is None:
+            idx = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+
+class SharedDataset:
+    """
+    Columnar view of the issues backed by a memory-mapped file.
+
+    Issue columns (one row per issue):
+    - number, state, creator, created, closed (seconds since epoch, NaN if missing)
+    - label_offsets / event_offsets: where the labels and events of each issue start
+
+    Label and event columns (one row per label or event):
+    - label_ids
+    - event_type, event_author, event_date
+
+    Strings are stored once in the users, labels and event_types tables
+    and referenced by their index.
+    """
+
+    def __init__(self, path: str):
+        """
+        Attaches to an existing dataset file. Use create() to write one.
+        """
+        self.path: str = path
+        self._owner: bool = False
+
+        with open(path, 'rb') as fin:
+            if fin.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f'{path} is not a shared dataset file')
+            header_size, = struct.unpack('<Q', fin.read(8))
+            header = json.loads(fin.read(header_size).decode('utf-8'))
+
+        self.users: List[str] = header['users']
+        self.labels: List[str] = header['labels']
+        self.event_types: List[str] = header['event_types']
+
+        self._buffer = np.memmap(path, dtype=np.uint8, mode='r')
+        self.columns: Dict[str, np.ndarray] = {
+            name: self._buffer[offset:offset + nbytes].view(dtype)
+            for name, (dtype, offset, nbytes) in header['columns'].items()
+        }
+
+    @classmethod
+    def create(cls, issues: List[Issue], path: str = None) -> 'SharedDataset':
+        """
+        Writes the issues into a new dataset file and attaches to it. The
+        returned dataset owns the file and deletes it when closed.
+        """
+        users, labels, event_types = _StringTable(), _StringTable(), _StringTable()
+        n = len(issues)
+
+        number = np.empty(n, dtype=np.int64)
+        state = np.empty(n, dtype=np.int8)
+        creator = np.empty(n, dtype=np.int32)
+        created = np.empty(n, dtype=np.float64)
+        closed = np.empty(n, dtype=np.float64)
+        label_offsets = np.zeros(n + 1, dtype=np.int64)
+        event_offsets = np.zeros(n + 1, dtype=np.int64)
+        label_ids, event_type, event_author, event_date = [], [], [], []
+
+        for i, issue in enumerate(issues):
+            number[i] = issue.number
+            state[i] = 1 if issue.state == State.closed else 0
+            creator[i] = users.intern(issue.creator)
+            created[i] = issue.created_date.timestamp() if issue.created_date else np.nan
+            closed[i] = issue.closed_date.timestamp() if issue.closed_date else np.nan
+            label_ids.extend(labels.intern(label) for label in issue.labels)
+            label_offsets[i + 1] = len(label_ids)
+            for e in issue.events:
+                event_type.append(event_types.intern(e.event_type))
+                event_author.append(users.intern(e.author))
+                event_date.append(e.event_date.timestamp() if e.event_date else np.nan)
+            event_offsets[i + 1] = len(event_type)
+
+        columns = {
+            'number': number,
+            'state': state,
+            'creator': creator,
+            'created': created,
+            'closed': closed,
+            'label_offsets': label_offsets,
+            'label_ids': np.asarray(label_ids, dtype=np.int32),
+            'event_offsets': event_offsets,
+            'event_type': np.asarray(event_type, dtype=np.int32),
+            'event_author': np.asarray(event_author, dtype=np.int32),
+            'event_date': np.asarray(event_date, dtype=np.float64),
+        }
+
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='enpm611_', suffix='.dataset')
+            os.close(fd)
+
+        header = {
+            'users': users.values,
+            'labels': labels.values,
+            'event_types': event_types.values,
+            'columns': {},
+        }
+        # Columns start after the header, which itself depends on the offsets,
+        # so reserve the offsets first and lay the columns out afterwards
+        layout_size = len(json.dumps(header).encode('utf-8')) + 128 * len(columns)
+        offset = _align(len(_MAGIC) + 8 + layout_size)
+        for name, arr in columns.items():
+            header['columns'][name] = (arr.dtype.str, offset, arr.nbytes)
+            offset = _align(offset + arr.nbytes)
+
+        encoded = json.dumps(header).encode('utf-8')
+        assert len(encoded) <= layout_size, \
+            f'Dataset header ({len(encoded)} bytes) does not fit in its reserved {layout_size} bytes'
+        with open(path, 'wb') as fout:
+            fout.write(_MAGIC)
+            fout.write(struct.pack('<Q', len(encoded)))
+            fout.write(encoded)
+            for name, arr in columns.items():
+                fout.seek(header['columns'][name][1])
+                fout.write(arr.tobytes())
+            fout.truncate(max(offset, fout.tell()))
+
+        dataset = cls(path)
+        dataset._owner = True
+        return dataset
+
+    def __len__(self):
+        return len(self.columns['number'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Releases the memory map. The owner of the file also deletes it.
+        """
+        self.columns = {}
+        self._buffer = None
+        if self._owner and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def label_stats(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """
+        Computes partial per-label statistics for the issues in [start, stop).
+        Partials of disjoint slices can be combined with merge_label_stats().
+        """
+        c = self.columns
+        n_labels, n_users = len(self.labels), max(len(self.users), 1)
+        n = stop - start
+
+        # Per issue: lifespan in hours and number of comments
+        lifespan = (c['closed'][start:stop] - c['created'][start:stop]) / 3600
+        ev_lo, ev_hi = c['event_offsets'][start], c['event_offsets'][stop]
+        ev_issue = np.repeat(np.arange(n), np.diff(c['event_offsets'][start:stop + 1]))
+        ev_author = c['event_author'][ev_lo:ev_hi]
+        commented = self.event_types.index('commented') if 'commented' in self.event_types else -2
+        num_comments = np.bincount(ev_issue[c['event_type'][ev_lo:ev_hi] == commented], minlength=n)
+
+        # One row per (issue, label) pair
+        lb_lo, lb_hi = c['label_offsets'][start], c['label_offsets'][stop]
+        lb_issue = np.repeat(np.arange(n), np.diff(c['label_offsets'][start:stop + 1]))
+        lb_label = c['label_ids'][lb_lo:lb_hi].astype(np.int64)
+
+        has_lifespan = ~np.isnan(lifespan[lb_issue])
+        stats = {
+            'issues': np.bincount(lb_label, minlength=n_labels),
+            'comments': np.bincount(lb_label, weights=num_comments[lb_issue], minlength=n_labels),
+            'lifespan_sum': np.bincount(lb_label[has_lifespan], weights=lifespan[lb_issue][has_lifespan],
+                                        minlength=n_labels),
+            'lifespan_count': np.bincount(lb_label[has_lifespan], minlength=n_labels),
+        }
+
+        # Distinct contributors (creator + event authors) per issue, sorted by issue
+        pair_issue = np.concatenate([np.arange(n), ev_issue])
+        pair_user = np.concatenate([c['creator'][start:stop], ev_author]).astype(np.int64)
+        known = pair_user >= 0
+        issue_users = np.unique(pair_issue[known] * n_users + pair_user[known])
+        users_per_issue = np.bincount(issue_users // n_users, minlength=n)
+        first_user = np.concatenate([[0], np.cumsum(users_per_issue)[:-1]])
+
+        # Expand every (issue, label) row into the contributors of that issue
+        lens = users_per_issue[lb_issue]
+        row_start = np.repeat(np.cumsum(lens) - lens, lens)
+        gather = np.repeat(first_user[lb_issue], lens) + np.arange(lens.sum()) - row_start
+        stats['contributors'] = np.unique(np.repeat(lb_label, lens) * n_users + issue_users[gather] % n_users)
+        return stats
+
+    @staticmethod
+    def merge_label_stats(partials: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        """
+        Combines the partial statistics of disjoint issue slices.
+        """
+        merged = {key: sum(p[key] for p in partials) for key in partials[0] if key != 'contributors'}
+        merged['contributors'] = np.unique(np.concatenate([p['contributors'] for p in partials]))
+        return merged
+
+    def label_stats_frame(self, stats: Dict[str, np.ndarray]) -> pd.DataFrame:
+        """
+        Converts the statistics into the table reported by AnalysisOne.
+        """
+        n_users = max(len(self.users), 1)
+        contributors = np.bincount(stats['contributors'] // n_users, minlength=len(self.labels))
+        results = []
+        for idx in np.nonzero(stats['issues'])[0]:
+            avg_lifespan = (stats['lifespan_sum'][idx] / stats['lifespan_count'][idx]
+                            if stats['lifespan_count'][idx] else None)
+            results.append({
+                "label": self.labels[idx],
+                "avg_lifespan_hours": round(avg_lifespan, 2) if avg_lifespan is not None else "N/A",
+                "avg_comments": round(stats['comments'][idx] / stats['issues'][idx], 2),
+                "num_contributors": int(contributors[idx])
+            })
+        return pd.DataFrame(results)
+
+    def parallel_label_stats(self, workers: int) -> pd.DataFrame:
+        """
+        Splits the issues into slices, computes the per-label statistics of
+        each slice in a pool of worker processes attached to this dataset,
+        and merges the partial results.
+        """
+        bounds = np.linspace(0, len(self), workers * 4 + 1, dtype=np.int64)
+        slices = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        if not slices:
+            return self.label_stats_frame(self.label_stats(0, 0))
+
+        with Pool(workers, initializer=_attach_worker, initargs=(self.path,)) as pool:
+            partials = pool.starmap(_worker_label_stats, slices)
+        return self.label_stats_frame(self.merge_label_stats(partials))
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _attach_worker(path: str):
+    global _WORKER_DATASET
+    _WORKER_DATASET = SharedDataset(path)
+
+
+def _worker_label_stats(start: int, stop: int) -> Dict[str, np.ndarray]:
+    return _WORKER_DATASET.label_stats(start, stop)
@@ -0,0 +1,90 @@
+import os
+import unittest
+
+import numpy as np
+
+from analysis_one import AnalysisOne
+from model import Issue
+from shared_dataset import SharedDataset
+
+
+def _issues():
+    records = []
+    for number in range(1, 41):
+        events = [
+            {"event_type": "commented" if k % 2 else "labeled",
+             "author": f"user{(number * 7 + k) % 31}",
+             "event_date": f"2020-02-{k + 1:02d}T00:00:00Z"}
+            for k in range(number % 5)
+        ]
+        if number % 9 == 0:
+            events.append({"event_type": "commented", "author": "", "event_date": None})
+        records.append({
+            "state": "closed" if number % 3 and number % 7 else "open",
+            "number": number,
+            "creator": f"user{number % 11}" if number % 10 else None,
+            "labels": [f"label{number % 4}", f"area{number % 8}"][:number % 3],
+            "created_date": f"2020-01-{number % 28 + 1:02d}T00:00:00Z",
+            "closed_date": f"2020-03-{number * 5 % 28 + 1:02d}T12:00:00Z" if number % 3 and number % 7 else None,
+            "events": events,
+        })
+    return [Issue(r) for r in records]
+
+
+def _sorted(df):
+    return df.sort_values("label").reset_index(drop=True)
+
+
+class TestSharedDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.issues = _issues()
+        self.dataset = SharedDataset.create(self.issues)
+
+    def tearDown(self):
+        path = self.dataset.path
+        self.dataset.close()
+        self.assertFalse(os.path.exists(path))
+
+    def test_columns_round_trip(self):
+        self.assertEqual(len(self.dataset), len(self.issues))
+        self.assertEqual(list(self.dataset.columns["number"]), [i.number for i in self.issues])
+        self.assertEqual(self.dataset.columns["event_offsets"][-1], sum(len(i.events) for i in self.issues))
+
+    def test_parallel_matches_serial(self):
+        serial = _sorted(AnalysisOne().compute_label_stats(self.issues))
+        parallel = _sorted(self.dataset.parallel_label_stats(2))
+
+        self.assertTrue(parallel.equals(serial))
+
+    def test_empty_slices_do_not_change_result(self):
+        n = len(self.dataset)
+        whole = self.dataset.label_stats(0, n)
+        merged = SharedDataset.merge_label_stats([
+            self.dataset.label_stats(0, 0),
+            self.dataset.label_stats(0, 17),
+            self.dataset.label_stats(17, 17),
+            self.dataset.label_stats(17, n),
+            self.dataset.label_stats(n, n),
+        ])
+
+        for key in whole:
+            np.testing.assert_array_equal(merged[key], whole[key])
+
+    def test_slice_without_labels(self):
+        # Issues with a number divisible by 3 have no labels
+        unlabeled = [i for i in self.issues if not i.labels]
+        with SharedDataset.create(unlabeled) as dataset:
+            stats = dataset.label_stats(0, len(dataset))
+            self.assertEqual(stats["issues"].sum(), 0)
+            self.assertEqual(len(stats["contributors"]), 0)
+            self.assertTrue(dataset.label_stats_frame(stats).empty)
+
+    def test_no_issues(self):
+        with SharedDataset.create([]) as dataset:
+            self.assertEqual(len(dataset), 0)
+            self.assertTrue(dataset.parallel_label_stats(2).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()